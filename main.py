@@ -21,9 +21,24 @@ def main():
     parser.add_argument(
         "--end-page", type=int, default=1615, help="Ending page number (default: 1615)"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help=(
+            "Number of scraper processes to split the page range across; "
+            "concurrency limits apply per process (default: 1)"
+        ),
+    )
     parser.add_argument(
         "--export", action="store_true", help="Export database to CSV and exit"
     )
+    parser.add_argument(
+        "--columns",
+        type=str,
+        default=None,
+        help="Comma-separated document columns to export (default: all columns)",
+    )
     parser.add_argument(
         "--db",
         type=str,
@@ -36,15 +51,26 @@ def main():
 
     args = parser.parse_args()
 
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+
     scraper = WilsonArchiveScraper(db_path=args.db)
 
     try:
         if args.stats:
             scraper.get_stats()
         elif args.export:
-            scraper.export_to_csv()
+            columns = (
+                [c.strip() for c in args.columns.split(",") if c.strip()]
+                if args.columns is not None
+                else None
+            )
+            try:
+                scraper.export_to_csv(columns=columns)
+            except ValueError as e:
+                parser.error(str(e))
         else:
-            scraper.scrape_range(args.start_page, args.end_page)
+            scraper.scrape_range(args.start_page, args.end_page, args.workers)
     except KeyboardInterrupt:
         print("\n\nExiting...")
         sys.exit(0)
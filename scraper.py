@@ -2,18 +2,75 @@
 Wilson Center Digital Archive Web Scraper
 
 This module contains the WilsonArchiveScraper class for scraping documents
-from the Wilson Center Digital Archive using SeleniumBase to avoid bot detection.
-It stores data in a SQLite database and supports resuming.
+from the Wilson Center Digital Archive. Pages are fetched over plain HTTP with
+httpx and parsed with selectolax; SeleniumBase is only used as a fallback when
+a bot challenge is served. It stores data in a SQLite database and supports
+resuming.
 """
 
+import asyncio
 import csv
 import json
+import multiprocessing
+import re
 import sqlite3
+import threading
 import time
-from datetime import datetime
-from typing import List, Dict, Optional, Any
-
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import partial
+from itertools import chain
+from typing import (
+    AsyncIterator,
+    List,
+    Dict,
+    Optional,
+    Any,
+    Set,
+    Iterable,
+    Iterator,
+    Sequence,
+    Tuple,
+)
+
+import httpx
+from selectolax.lexbor import LexborHTMLParser as HTMLParser
+from selectolax.lexbor import LexborNode as Node
+from selenium.common.exceptions import NoSuchElementException
 from seleniumbase import Driver
+from seleniumbase.common import exceptions as sb_exceptions
+
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/126.0.0.0 Safari/537.36"
+)
+
+# Markers that identify a bot challenge page instead of real content
+CHALLENGE_MARKERS = (
+    "<title>Just a moment...</title>",
+    "triggerInterstitialChallenge",
+)
+
+# Elements rendered as blocks, which start and end a line of text
+BLOCK_TAGS = frozenset(
+    "address article aside blockquote body caption center dd details dialog dir "
+    "div dl dt fieldset figcaption figure footer form h1 h2 h3 h4 h5 h6 header "
+    "hgroup hr html legend li main menu nav ol p pre section summary table tbody "
+    "tfoot thead tr ul".split()
+)
+
+# Elements rendered as table cells, which end in a separating space
+CELL_TAGS = frozenset({"td", "th"})
+
+# Nodes whose content never shows up in rendered text
+SKIPPED_TAGS = frozenset(
+    {"-comment", "head", "noscript", "script", "style", "template", "title"}
+)
+
+# Whitespace that rendered text collapses and trims; non-breaking spaces survive
+COLLAPSIBLE_SPACE = re.compile(r"[ \f\t\v\u2028\u2029]+")
+TRIMMABLE_SPACE = re.compile(r"^[^\S\xa0]+|[^\S\xa0]+$")
 
 
 class WilsonArchiveScraper:
@@ -22,18 +79,129 @@ class WilsonArchiveScraper:
     BASE_URL = "https://digitalarchive.wilsoncenter.org"
     SEARCH_URL = f"{BASE_URL}/search?page={{}}"
 
+    # Stored in PRAGMA user_version; bump when _migrate_schema gains a step
+    SCHEMA_VERSION = 4
+
+    # Columns of the documents table, in schema order
+    DOCUMENT_COLUMNS = (
+        "document_url",
+        "page_number",
+        "page_position",
+        "original_publication_date",
+        "title",
+        "credits",
+        "text_body",
+        "summary",
+        "authors",
+        "associated_places",
+        "subjects_discussed",
+        "associated_people_orgs",
+        "document_contributors",
+        "source",
+        "original_upload_date",
+        "original_archive_title",
+        "language",
+        "rights",
+        "record_id",
+        "original_classification",
+        "donors",
+        "scraped_at",
+    )
+
+    # Upsert keyed on document_url, bound by name straight from metadata dicts
+    _INSERT_SQL = (
+        f"INSERT INTO documents ({', '.join(DOCUMENT_COLUMNS)}) "
+        f"VALUES ({', '.join(':' + column for column in DOCUMENT_COLUMNS)}) "
+        "ON CONFLICT(document_url) DO UPDATE SET "
+        + ", ".join(f"{column} = excluded.{column}" for column in DOCUMENT_COLUMNS[1:])
+    )
+
+    # CSS selectors, defined once and shared by every page and document
+    SEARCH_LINK_SELECTORS = (
+        "td.document.contextual-region a",
+        "td.document a",
+        ".views-row a[href*='/document/']",
+        "a[href*='/document/']",
+    )
+    SELECTORS = {
+        "document_link": "a[href*='/document/']",
+        "information_block": ".information-block",
+        "information_title": ".sub-title",
+        "information_text": ".text",
+        "section_title": "h2.title",
+        "pill_block": ".pill-block, .information-block",
+        "pill_block_title": "h3.title, h4.title, h3.sub-title",
+        "pill_name": ".pill .name span",
+        "pill_name_fallback": ".pill .name",
+    }
+
+    # Document fields read as plain text, keyed by metadata field
+    TEXT_FIELDS = {
+        "original_publication_date": ".date",
+        "title": "h1.title",
+        "credits": ".donated",
+        "text_body": ".tab-pane.active",
+        "summary": ".text-block",
+    }
+
+    # Document fields read from pill lists, keyed by metadata field
+    PILL_FIELDS = {
+        "authors": "Author",
+        "associated_places": "Associated Places",
+        "subjects_discussed": "Subjects Discussed",
+        "associated_people_orgs": "Associated People",
+        "document_contributors": "Document Contributor",
+        "original_archive_title": "Original Archive",
+        "language": "Language",
+        "donors": "Donor",
+    }
+
+    # Document fields read from information blocks, keyed by metadata field
+    INFORMATION_FIELDS = {
+        "source": "Source",
+        "original_upload_date": "Original Uploaded Date",
+        "rights": "Rights",
+        "record_id": "Record ID",
+        "original_classification": "Original Classification",
+    }
+
+    # Politeness budget per process: search pages and document fetches in flight
+    PAGE_CONCURRENCY = 4
+    DOCUMENT_CONCURRENCY = 10
+
+    # A 429 is retried this many times, waiting Retry-After (capped) in between
+    RATE_LIMIT_RETRIES = 3
+    MAX_RETRY_AFTER = 60
+
     def __init__(self, db_path: str = "wilson_archive.db"):
         """Initialize the scraper with database connection"""
         self.db_path = db_path
         self.conn: Optional[sqlite3.Connection] = None
+        self._completed: Set[int] = set()
+        self.client: Optional[httpx.AsyncClient] = None
         self.driver: Any = None
+        self._driver_lock = threading.Lock()
+        self._page_semaphore: Optional[asyncio.Semaphore] = None
+        self._document_semaphore: Optional[asyncio.Semaphore] = None
         self._init_database()
 
     def _init_database(self):
         """Initialize SQLite database with required schema"""
-        self.conn = sqlite3.connect(self.db_path)
+        # A larger statement cache keeps every hot-path query prepared
+        # timeout is SQLite's busy timeout: writers from other worker processes
+        # are waited on instead of failing with "database is locked"
+        self.conn = sqlite3.connect(self.db_path, timeout=30, cached_statements=256)
         cursor = self.conn.cursor()
 
+        # page_size only takes effect on a brand new database, so it must be set
+        # before anything (including the WAL switch) writes to the file
+        cursor.execute("PRAGMA page_size = 8192")
+        cursor.execute("PRAGMA journal_mode = WAL")
+        cursor.execute("PRAGMA synchronous = NORMAL")
+        cursor.execute("PRAGMA cache_size = -65536")  # 64MB
+        cursor.execute("PRAGMA temp_store = MEMORY")
+        cursor.execute("PRAGMA mmap_size = 268435456")  # 256MB
+
         cursor.execute(
             """
             CREATE TABLE IF NOT EXISTS documents (
@@ -63,39 +231,10 @@ class WilsonArchiveScraper:
         """
         )
 
-        try:
-            cursor.execute("ALTER TABLE documents ADD COLUMN page_number INTEGER")
-            self.conn.commit()
-        except sqlite3.OperationalError:
-            pass
-
-        try:
-            cursor.execute(
-                "ALTER TABLE documents ADD COLUMN document_contributors TEXT"
-            )
-            self.conn.commit()
-        except sqlite3.OperationalError:
-            pass
-
-        try:
-            cursor.execute("ALTER TABLE documents ADD COLUMN page_position INTEGER")
-            self.conn.commit()
-        except sqlite3.OperationalError:
-            pass
-
-        cursor.execute(
-            """
-            CREATE INDEX IF NOT EXISTS idx_documents_page_number 
-            ON documents(page_number)
-        """
-        )
-
-        cursor.execute(
-            """
-            CREATE INDEX IF NOT EXISTS idx_documents_page_position 
-            ON documents(page_number, page_position)
-        """
-        )
+        cursor.execute("PRAGMA user_version")
+        version = cursor.fetchone()[0]
+        if version < self.SCHEMA_VERSION:
+            self._migrate_schema(version)
 
         cursor.execute(
             """
@@ -108,13 +247,93 @@ class WilsonArchiveScraper:
 
         self.conn.commit()
 
+        # Resume checks run once per page, so keep completed pages in memory
+        cursor.execute("SELECT page_number FROM completed_pages")
+        self._completed = {row[0] for row in cursor}
+
+    def _migrate_schema(self, version: int):
+        """Upgrade an older database from the given user_version in one transaction"""
+        assert self.conn is not None
+        cursor = self.conn.cursor()
+        cursor.execute("BEGIN")
+
+        if version < 3:
+            # Columns added after the original schema
+            cursor.execute("PRAGMA table_info(documents)")
+            existing = {row[1] for row in cursor.fetchall()}
+            for column, column_type in (
+                ("page_number", "INTEGER"),
+                ("document_contributors", "TEXT"),
+                ("page_position", "INTEGER"),
+            ):
+                if column not in existing:
+                    cursor.execute(
+                        f"ALTER TABLE documents ADD COLUMN {column} {column_type}"
+                    )
+
+        if version < 4:
+            # One index in export order lets SQLite skip the sort in export_to_csv;
+            # it also covers every lookup the two older page indexes served
+            cursor.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_documents_export
+                ON documents(page_number, page_position, document_url)
+            """
+            )
+            cursor.execute("DROP INDEX IF EXISTS idx_documents_page_number")
+            cursor.execute("DROP INDEX IF EXISTS idx_documents_page_position")
+            cursor.execute("ANALYZE")
+
+        cursor.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+        self.conn.commit()
+
+    def _init_client(self):
+        """Initialize the shared HTTP client used for all page fetches"""
+        if self.client is None:
+            self.client = httpx.AsyncClient(
+                http2=True,
+                # Every request goes to one host, so keep idle connections around
+                # long enough to be reused across pages instead of re-handshaking
+                limits=httpx.Limits(
+                    max_connections=100,
+                    max_keepalive_connections=20,
+                    keepalive_expiry=30,
+                ),
+                headers={"User-Agent": USER_AGENT},
+                follow_redirects=True,
+                timeout=30,
+            )
+
+    async def _close_client(self):
+        """Close the shared HTTP client"""
+        if self.client:
+            await self.client.aclose()
+            self.client = None
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator["WilsonArchiveScraper"]:
+        """Open the HTTP client on the running event loop and close it on exit"""
+        self._init_client()
+        try:
+            yield self
+        finally:
+            await self._close_client()
+
     def _init_driver(self):
         """Initialize SeleniumBase driver with settings to avoid bot detection"""
         if self.driver is None:
             # SeleniumBase Driver with UC mode (undetected-chromedriver)
             # uc=True uses undetected-chromedriver to bypass bot detection like triggerInterstitialChallenge()
             # headless=True runs without visible browser window
-            self.driver = Driver(uc=True, headless=True)
+            # block_images=True skips image downloads, which scraping never needs
+            # page_load_strategy="eager" returns at DOMContentLoaded; readiness is
+            # then decided by waiting for the target selector
+            self.driver = Driver(
+                uc=True,
+                headless=True,
+                block_images=True,
+                page_load_strategy="eager",
+            )
             print("SeleniumBase driver initialized with undetected mode")
 
     def _close_driver(self):
@@ -123,60 +342,123 @@ class WilsonArchiveScraper:
             self.driver.quit()
             self.driver = None
 
+    async def fetch(self, url: str, ready_selector: str) -> str:
+        """Fetch page HTML over HTTP, falling back to the browser on a bot challenge"""
+        # The client is bound to the event loop it was opened on, so it is only
+        # ever opened and closed by session()
+        if self.client is None:
+            raise RuntimeError(
+                "fetch() needs an open client: use 'async with session()'"
+            )
+        response = await self.client.get(url)
+
+        # A rate limit is not a bot challenge: the browser would be refused
+        # too, so back off and retry, then let raise_for_status() give up
+        for attempt in range(self.RATE_LIMIT_RETRIES):
+            if response.status_code != 429:
+                break
+            delay = self._retry_after(response, attempt)
+            print(f"Rate limited at {url}, retrying in {delay:.0f}s")
+            await asyncio.sleep(delay)
+            response = await self.client.get(url)
+
+        if response.status_code in (403, 503) or any(
+            marker in response.text for marker in CHALLENGE_MARKERS
+        ):
+            print(f"Bot challenge detected at {url}, falling back to browser")
+            return await asyncio.to_thread(self._fetch_with_driver, url, ready_selector)
+
+        response.raise_for_status()
+        return response.text
+
+    def _retry_after(self, response: httpx.Response, attempt: int) -> float:
+        """Seconds to wait before retrying a rate-limited response"""
+        header = response.headers.get("Retry-After", "")
+        try:
+            delay = float(header)
+        except ValueError:
+            try:
+                retry_at = parsedate_to_datetime(header)
+                delay = (retry_at - datetime.now(timezone.utc)).total_seconds()
+            except (TypeError, ValueError):
+                # No usable header, so back off exponentially
+                delay = 2.0**attempt
+        return min(max(delay, 0.0), self.MAX_RETRY_AFTER)
+
+    def _fetch_with_driver(self, url: str, ready_selector: str) -> str:
+        """Fetch page HTML with the SeleniumBase driver once ready_selector is present"""
+        # The driver is shared across worker threads, so navigate one at a time
+        with self._driver_lock:
+            self._init_driver()
+            self.driver.get(url)
+            # SeleniumBase raises its own NoSuchElementException on timeout;
+            # older releases raised Selenium's
+            try:
+                self.driver.wait_for_element_present(ready_selector, timeout=10)
+            except (sb_exceptions.NoSuchElementException, NoSuchElementException):
+                # Give a slow page a last moment before taking what has loaded
+                print(f"Timed out waiting for {ready_selector} at {url}")
+                time.sleep(0.5)
+            return self.driver.page_source
+
     def is_page_completed(self, page_number: int) -> bool:
         """Check if a page has already been scraped"""
-        assert self.conn is not None
-        cursor = self.conn.cursor()
-        cursor.execute(
-            "SELECT 1 FROM completed_pages WHERE page_number = ?", (page_number,)
-        )
-        return cursor.fetchone() is not None
+        return page_number in self._completed
 
     def mark_page_completed(self, page_number: int):
         """Mark a page as completed"""
         assert self.conn is not None
-        cursor = self.conn.cursor()
-        cursor.execute(
-            "INSERT OR REPLACE INTO completed_pages (page_number, completed_at) VALUES (?, ?)",
+        with self.conn:
+            self._insert_completed_page(page_number)
+        self._completed.add(page_number)
+
+    def _insert_completed_page(self, page_number: int):
+        """Record a completed page in the current transaction without committing"""
+        assert self.conn is not None
+        self.conn.execute(
+            "INSERT OR IGNORE INTO completed_pages (page_number, completed_at) VALUES (?, ?)",
             (page_number, datetime.now().isoformat()),
         )
-        self.conn.commit()
 
-    def get_document_links(self, page_number: int) -> List[str]:
+    def get_scraped_urls(self, document_urls: List[str]) -> Set[str]:
+        """Return the subset of document URLs already saved with their content"""
+        if not document_urls:
+            return set()
+        assert self.conn is not None
+        placeholders = ", ".join("?" * len(document_urls))
+        cursor = self.conn.execute(
+            # Rows without a title came from failed fetches, so scrape them again
+            "SELECT document_url FROM documents "
+            f"WHERE document_url IN ({placeholders}) AND title IS NOT NULL",
+            document_urls,
+        )
+        return {row[0] for row in cursor}
+
+    async def get_document_links(self, page_number: int) -> List[str]:
         """Extract document links from a search results page"""
         url = self.SEARCH_URL.format(page_number)
         print(f"Accessing page {page_number}: {url}")
 
-        self.driver.get(url)
-        time.sleep(5)
+        html = await self.fetch(url, ready_selector=self.SELECTORS["document_link"])
 
-        links = []
+        # Insertion-ordered dict: O(1) dedup that keeps the page order
+        links: Dict[str, None] = {}
         try:
-            selectors = [
-                "td.document.contextual-region a",
-                "td.document a",
-                ".views-row a[href*='/document/']",
-                "a[href*='/document/']",
-            ]
-
-            for selector in selectors:
-                try:
-                    elements = self.driver.find_elements("css selector", selector)
-                    if elements:
-                        print(
-                            f"Found {len(elements)} elements with selector: {selector}"
-                        )
-                        break
-                except:
-                    continue
+            tree = HTMLParser(html)
+
+            elements: List[Node] = []
+            for selector in self.SEARCH_LINK_SELECTORS:
+                elements = tree.css(selector)
+                if elements:
+                    print(f"Found {len(elements)} elements with selector: {selector}")
+                    break
 
             if not elements:
                 print("No elements found with any selector. Checking page structure...")
-                page_source = self.driver.page_source[:1000]
-                print(f"Page source preview: {page_source}")
+                print(f"Page source preview: {html[:1000]}")
 
             for element in elements:
-                href = element.get_attribute("href")
+                href = element.attributes.get("href")
 
                 if href and "/document/" in href:
 
@@ -185,8 +467,7 @@ class WilsonArchiveScraper:
                     else:
                         full_url = href
 
-                    if full_url not in links:
-                        links.append(full_url)
+                    links[full_url] = None
 
             print(f"Found {len(links)} document links on page {page_number}")
         except Exception as e:
@@ -195,172 +476,171 @@ class WilsonArchiveScraper:
 
             traceback.print_exc()
 
-        return links
+        return list(links)
 
-    def _get_text_safe(self, selector: str, multiple: bool = False) -> Optional[str]:
-        """Safely extract text from element(s) by CSS selector"""
-        try:
-            if multiple:
-                elements = self.driver.find_elements("css selector", selector)
-                texts = [el.text.strip() for el in elements if el.text.strip()]
-                return json.dumps(texts) if texts else None
-            else:
-                element = self.driver.find_element("css selector", selector)
-                return element.text.strip() if element.text.strip() else None
-        except:
-            return None
+    @staticmethod
+    def _node_text(node: Node) -> str:
+        """Render the visible text of a node the way Selenium's element.text does"""
+        lines = [""]
 
-    def _get_information_block(self, title: str) -> Optional[str]:
+        def walk(parent: Node, preformatted: bool):
+            for child in parent.iter(include_text=True):
+                if child.tag == "-text":
+                    text = child.text(deep=False).replace("\r\n", "\n")
+                    if preformatted:
+                        text = text.replace(" ", "\xa0")
+                    else:
+                        text = COLLAPSIBLE_SPACE.sub(" ", text.replace("\n", " "))
+                        if lines[-1].endswith(" ") and text.startswith(" "):
+                            text = text[1:]
+                    lines[-1] += text
+                elif child.tag == "br":
+                    lines.append("")
+                elif child.tag not in SKIPPED_TAGS:
+                    is_block = child.tag in BLOCK_TAGS
+                    if is_block and lines[-1].strip():
+                        lines.append("")
+                    walk(child, preformatted or child.tag == "pre")
+                    line = lines[-1]
+                    if child.tag in CELL_TAGS and line and not line.endswith(" "):
+                        lines[-1] += " "
+                    if is_block and line.strip():
+                        lines.append("")
+
+        walk(node, node.tag == "pre")
+        # Like Selenium, trim each line but keep non-breaking spaces (rendered as
+        # plain spaces) and the blank lines left by consecutive <br> tags
+        text = "\n".join(TRIMMABLE_SPACE.sub("", line) for line in lines)
+        return TRIMMABLE_SPACE.sub("", text).replace("\xa0", " ")
+
+    @staticmethod
+    def _next_element(node: Node) -> Optional[Node]:
+        """Return the next sibling element, skipping text and comment nodes"""
+        sibling = node.next
+        while sibling is not None and sibling.tag in ("-text", "-comment"):
+            sibling = sibling.next
+        return sibling
+
+    @classmethod
+    def _title_key(cls, node: Node) -> str:
+        """Lowercased rendered title, so &nbsp; and line breaks still match"""
+        return cls._node_text(node).replace("\n", " ").lower()
+
+    def _get_text_safe(
+        self, tree: HTMLParser, selector: str, multiple: bool = False
+    ) -> Optional[str]:
+        """Safely extract text from element(s) by CSS selector"""
+        if multiple:
+            texts = [text for text in map(self._node_text, tree.css(selector)) if text]
+            return json.dumps(texts) if texts else None
+        else:
+            element = tree.css_first(selector)
+            if element is None:
+                return None
+            text = self._node_text(element)
+            return text if text else None
+
+    def _get_information_block(
+        self, info_blocks: List[Tuple[str, Node]], title: str
+    ) -> Optional[str]:
         """Extract text from information block by title"""
-        try:
-            # Find all information blocks
-            blocks = self.driver.find_elements("css selector", ".information-block")
-            for block in blocks:
-                try:
-                    subtitle = block.find_element("css selector", ".sub-title")
-                    if subtitle and title.lower() in subtitle.text.lower():
-                        # Try to get text from .text div
-                        text_div = block.find_element("css selector", ".text")
-                        return text_div.text.strip() if text_div.text.strip() else None
-                except:
+        title = title.lower()
+        for subtitle, block in info_blocks:
+            if title in subtitle:
+                # Try to get text from .text div
+                text_div = block.css_first(self.SELECTORS["information_text"])
+                if text_div is None:
                     continue
-            return None
-        except:
-            return None
-
-    def _get_pill_list(self, title: str) -> Optional[str]:
+                text = self._node_text(text_div)
+                return text if text else None
+        return None
+
+    def _get_pill_list(
+        self,
+        section_titles: List[Tuple[str, Node]],
+        pill_blocks: List[Tuple[str, Node]],
+        title: str,
+    ) -> Optional[str]:
         """Extract pill list items (authors, places, etc.) by section title"""
-        try:
-            h2_elements = self.driver.find_elements("css selector", "h2.title")
-            for h2 in h2_elements:
-                try:
-                    if title.lower() in h2.text.lower():
-                        next_elem = self.driver.execute_script(
-                            "return arguments[0].nextElementSibling;", h2
-                        )
-                        if next_elem:
-                            pills = self.driver.execute_script(
-                                'return Array.from(arguments[0].querySelectorAll(".pill .name span"));',
-                                next_elem,
-                            )
-                            if pills:
-                                names = [
-                                    p.text.strip() for p in pills if p.text.strip()
-                                ]
-                                return json.dumps(names) if names else None
-                except:
-                    continue
-
-            blocks = self.driver.find_elements(
-                "css selector", ".pill-block, .information-block"
-            )
-            for block in blocks:
-                try:
-                    title_els = block.find_elements(
-                        "css selector", "h3.title, h4.title, h3.sub-title"
-                    )
-                    for title_el in title_els:
-                        if title.lower() in title_el.text.lower():
-                            pills = block.find_elements(
-                                "css selector", ".pill .name span"
-                            )
-                            if not pills:
-                                pills = block.find_elements(
-                                    "css selector", ".pill .name"
-                                )
-                            if pills:
-                                names = [
-                                    p.text.strip() for p in pills if p.text.strip()
-                                ]
-                                return json.dumps(names) if names else None
-                except:
-                    continue
-            return None
-        except:
-            return None
-
-    def scrape_document(self, document_url: str) -> Dict:
+        title = title.lower()
+        for heading, h2 in section_titles:
+            if title in heading:
+                next_elem = self._next_element(h2)
+                if next_elem is not None:
+                    pills = next_elem.css(self.SELECTORS["pill_name"])
+                    if pills:
+                        names = [name for name in map(self._node_text, pills) if name]
+                        return json.dumps(names) if names else None
+
+        for block_title, block in pill_blocks:
+            if title in block_title:
+                pills = block.css(self.SELECTORS["pill_name"])
+                if not pills:
+                    pills = block.css(self.SELECTORS["pill_name_fallback"])
+                if pills:
+                    names = [name for name in map(self._node_text, pills) if name]
+                    return json.dumps(names) if names else None
+        return None
+
+    async def scrape_document(self, document_url: str) -> Dict:
         """Scrape metadata from a single document page"""
         print(f"Scraping document: {document_url}")
 
-        self.driver.get(document_url)
-        time.sleep(3)
-
-        metadata = {
-            "document_url": document_url,
-            "original_publication_date": self._get_text_safe(".date"),
-            "title": self._get_text_safe("h1.title"),
-            "credits": self._get_text_safe(".donated"),
-            "text_body": self._get_text_safe(".tab-pane.active"),
-            "summary": self._get_text_safe(".text-block"),
-            "scraped_at": datetime.now().isoformat(),
-        }
-
-        metadata["authors"] = self._get_pill_list("Author")
-        metadata["associated_places"] = self._get_pill_list("Associated Places")
-        metadata["subjects_discussed"] = self._get_pill_list("Subjects Discussed")
-        metadata["associated_people_orgs"] = self._get_pill_list("Associated People")
-        metadata["document_contributors"] = self._get_pill_list("Document Contributor")
-
-        metadata["source"] = self._get_information_block("Source")
-        metadata["original_upload_date"] = self._get_information_block(
-            "Original Uploaded Date"
+        tree = HTMLParser(
+            await self.fetch(document_url, ready_selector=self.TEXT_FIELDS["title"])
         )
-        metadata["original_archive_title"] = self._get_pill_list("Original Archive")
-        metadata["language"] = self._get_pill_list("Language")
-        metadata["rights"] = self._get_information_block("Rights")
-        metadata["record_id"] = self._get_information_block("Record ID")
-        metadata["original_classification"] = self._get_information_block(
-            "Original Classification"
-        )
-        metadata["donors"] = self._get_pill_list("Donor")
+
+        metadata: Dict[str, Any] = {"document_url": document_url}
+        for field, selector in self.TEXT_FIELDS.items():
+            metadata[field] = self._get_text_safe(tree, selector)
+
+        # Query each kind of section once and lowercase its title once, so the
+        # per-field lookups below only compare precomputed strings
+        section_titles = [
+            (self._title_key(h2), h2)
+            for h2 in tree.css(self.SELECTORS["section_title"])
+        ]
+        pill_blocks = [
+            (self._title_key(title_el), block)
+            for block in tree.css(self.SELECTORS["pill_block"])
+            for title_el in block.css(self.SELECTORS["pill_block_title"])
+        ]
+        info_blocks = []
+        for block in tree.css(self.SELECTORS["information_block"]):
+            subtitle = block.css_first(self.SELECTORS["information_title"])
+            if subtitle is not None:
+                info_blocks.append((self._title_key(subtitle), block))
+
+        for field, title in self.PILL_FIELDS.items():
+            metadata[field] = self._get_pill_list(section_titles, pill_blocks, title)
+        for field, title in self.INFORMATION_FIELDS.items():
+            metadata[field] = self._get_information_block(info_blocks, title)
+        metadata["scraped_at"] = datetime.now().isoformat()
 
         return metadata
 
     def save_document(self, metadata: Dict):
         """Save document metadata to database"""
+        self.save_documents_bulk([metadata])
+        print(f"Saved document: {metadata.get('title', 'Unknown')}")
+
+    def save_documents_bulk(self, documents: List[Dict]):
+        """Save several documents' metadata in a single transaction"""
         assert self.conn is not None
-        cursor = self.conn.cursor()
-        cursor.execute(
-            """
-            INSERT OR REPLACE INTO documents (
-                document_url, page_number, page_position, original_publication_date, title, credits, text_body,
-                summary, authors, associated_places, subjects_discussed,
-                associated_people_orgs, document_contributors, source, original_upload_date,
-                original_archive_title, language, rights, record_id,
-                original_classification, donors, scraped_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-            (
-                metadata["document_url"],
-                metadata.get("page_number"),
-                metadata.get("page_position"),
-                metadata.get("original_publication_date"),
-                metadata.get("title"),
-                metadata.get("credits"),
-                metadata.get("text_body"),
-                metadata.get("summary"),
-                metadata.get("authors"),
-                metadata.get("associated_places"),
-                metadata.get("subjects_discussed"),
-                metadata.get("associated_people_orgs"),
-                metadata.get("document_contributors"),
-                metadata.get("source"),
-                metadata.get("original_upload_date"),
-                metadata.get("original_archive_title"),
-                metadata.get("language"),
-                metadata.get("rights"),
-                metadata.get("record_id"),
-                metadata.get("original_classification"),
-                metadata.get("donors"),
-                metadata["scraped_at"],
-            ),
+        with self.conn:
+            self._insert_documents(documents)
+
+    def _insert_documents(self, documents: List[Dict]):
+        """Insert document rows in the current transaction without committing"""
+        assert self.conn is not None
+        # Fields a caller left out are stored as NULL
+        empty = dict.fromkeys(self.DOCUMENT_COLUMNS)
+        self.conn.executemany(
+            self._INSERT_SQL, ({**empty, **metadata} for metadata in documents)
         )
-        self.conn.commit()
-        print(f"Saved document: {metadata.get('title', 'Unknown')}")
 
-    def scrape_page(self, page_number: int):
-        """Scrape all documents from a single search results page"""
+    async def scrape_page(self, page_number: int):
+        """Scrape all documents from a search results page; run via _scrape_pages_async"""
         page_start_time = time.time()
 
         print(f"\n{'='*60}")
@@ -371,100 +651,188 @@ class WilsonArchiveScraper:
             print(f"Page {page_number} already completed, skipping...")
             return
 
-        document_links = self.get_document_links(page_number)
+        document_links = await self.get_document_links(page_number)
 
         if not document_links:
             print(f"No documents found on page {page_number}")
             self.mark_page_completed(page_number)
             return
 
-        for i, doc_url in enumerate(document_links, 1):
-            try:
-                print(f"\nDocument {i}/{len(document_links)}")
-                metadata = self.scrape_document(doc_url)
-                metadata["page_number"] = page_number
-                metadata["page_position"] = i
-                self.save_document(metadata)
-                time.sleep(1)
-            except KeyboardInterrupt:
-                raise
-            except Exception as e:
-                print(f"Error scraping document {doc_url}: {e}")
+        already_scraped = self.get_scraped_urls(document_links)
+        if already_scraped:
+            print(f"Skipping {len(already_scraped)} documents already in database")
 
-        self.mark_page_completed(page_number)
+        results = await asyncio.gather(
+            *(
+                self._scrape_document_task(page_number, i, len(document_links), url)
+                for i, url in enumerate(document_links, 1)
+                if url not in already_scraped
+            )
+        )
+        documents = [metadata for metadata in results if metadata is not None]
+
+        # One transaction (and one commit) covers the whole page
+        assert self.conn is not None
+        with self.conn:
+            self._insert_documents(documents)
+            self._insert_completed_page(page_number)
+        self._completed.add(page_number)
+        print(f"Saved {len(documents)} documents from page {page_number}")
 
         page_elapsed_time = time.time() - page_start_time
         minutes = int(page_elapsed_time // 60)
         seconds = int(page_elapsed_time % 60)
         print(f"Page {page_number} marked as completed ({minutes}m {seconds}s)")
 
-    def scrape_range(self, start_page: int = 0, end_page: int = 1615):
-        """Scrape a range of pages"""
-        print(f"Starting scraper for pages {start_page} to {end_page}")
+    async def _scrape_document_task(
+        self, page_number: int, position: int, total: int, document_url: str
+    ) -> Optional[Dict]:
+        """Scrape one document, bounded by the document semaphore"""
+        assert self._document_semaphore is not None
+        async with self._document_semaphore:
+            try:
+                print(f"\nDocument {position}/{total} on page {page_number}")
+                metadata = await self.scrape_document(document_url)
+                if metadata["title"] is None:
+                    # The page never rendered (e.g. the browser fallback timed
+                    # out), so storing it would only block a later retry
+                    print(f"No title found at {document_url}, not saving")
+                    return None
+                metadata["page_number"] = page_number
+                metadata["page_position"] = position
+                return metadata
+            except Exception as e:
+                print(f"Error scraping document {document_url}: {e}")
+                return None
+
+    async def _scrape_page_task(self, page_number: int):
+        """Scrape one search page, bounded by the page semaphore"""
+        assert self._page_semaphore is not None
+        async with self._page_semaphore:
+            try:
+                await self.scrape_page(page_number)
+            except Exception as e:
+                print(f"Error processing page {page_number}: {e}")
+
+    async def _scrape_pages_async(self, page_numbers: Iterable[int]):
+        """Scrape the given pages concurrently, owning the client and semaphores"""
+        # Semaphores are created here so they belong to the running event loop
+        self._page_semaphore = asyncio.Semaphore(self.PAGE_CONCURRENCY)
+        self._document_semaphore = asyncio.Semaphore(self.DOCUMENT_CONCURRENCY)
+
+        async with self.session():
+            await asyncio.gather(
+                *(self._scrape_page_task(page_num) for page_num in page_numbers)
+            )
+
+    def _scrape_range_in_processes(self, start_page: int, end_page: int, workers: int):
+        """Split the pending pages of a range across worker processes"""
+        pending = [
+            page_num
+            for page_num in range(start_page, end_page + 1)
+            if not self.is_page_completed(page_num)
+        ]
+        # Stripe pages across workers so each gets an even share of the range
+        chunks = [pending[i::workers] for i in range(workers) if pending[i::workers]]
+        if not chunks:
+            print("All pages in range already completed")
+            return
 
-        self._init_driver()
+        with multiprocessing.Pool(processes=len(chunks)) as pool:
+            for _ in pool.imap_unordered(
+                partial(_scrape_pages_worker, self.db_path), chunks
+            ):
+                pass
+
+    def scrape_range(self, start_page: int = 0, end_page: int = 1615, workers: int = 1):
+        """Scrape a range of pages, optionally split across worker processes"""
+        print(f"Starting scraper for pages {start_page} to {end_page}")
 
         try:
-            for page_num in range(start_page, end_page + 1):
-                try:
-                    self.scrape_page(page_num)
-                except KeyboardInterrupt:
-                    raise
-                except Exception as e:
-                    print(f"Error processing page {page_num}: {e}")
+            if workers > 1:
+                self._scrape_range_in_processes(start_page, end_page, workers)
+            else:
+                asyncio.run(self._scrape_pages_async(range(start_page, end_page + 1)))
         except KeyboardInterrupt:
             self.get_stats()
         finally:
             self._close_driver()
 
-    def export_to_csv(self, output_file: str = "wilson_archive.csv"):
-        """Export all documents from database to CSV ordered by page number and position"""
+    def export_to_csv(
+        self,
+        output_file: str = "wilson_archive.csv",
+        columns: Optional[List[str]] = None,
+    ):
+        """Export documents (all columns, or the given subset) to CSV ordered by page number and position"""
+        if columns is None:
+            columns = list(self.DOCUMENT_COLUMNS)
+        if not columns:
+            raise ValueError("No document columns given to export")
+        unknown = [column for column in columns if column not in self.DOCUMENT_COLUMNS]
+        if unknown:
+            raise ValueError(f"Unknown document columns: {', '.join(unknown)}")
+
         print(f"\nExporting data to {output_file}")
 
         assert self.conn is not None
-        cursor = self.conn.cursor()
-        cursor.execute(
-            "SELECT * FROM documents ORDER BY page_number ASC, page_position ASC, document_url ASC"
+        # Name the columns explicitly so unselected ones (like large text bodies)
+        # are never read
+        cursor = self.conn.execute(
+            f"SELECT {', '.join(columns)} FROM documents "
+            "ORDER BY page_number ASC, page_position ASC, document_url ASC"
         )
-        rows = cursor.fetchall()
+        first_row = cursor.fetchone()
 
-        if not rows:
+        if first_row is None:
             print("No documents found in database")
             return
 
-        columns = [description[0] for description in cursor.description]
+        header = list(columns)
 
         page_number_idx = (
-            columns.index("page_number") if "page_number" in columns else None
+            header.index("page_number") if "page_number" in header else None
         )
 
         if page_number_idx is not None:
-            insert_idx = page_number_idx + 1
-            columns.insert(insert_idx, "page_number_one_indexed")
-        else:
-            columns.insert(1, "page_number_one_indexed")
+            header.insert(page_number_idx + 1, "page_number_one_indexed")
+
+        # Count rows as they stream out of the single SELECT, so the total matches
+        # what was written even while a scrape is adding documents
+        exported = 0
+
+        def counted_rows() -> Iterator[Sequence]:
+            nonlocal exported
+            for row in chain((first_row,), cursor):
+                exported += 1
+                yield row
 
         with open(output_file, "w", newline="", encoding="utf-8") as csvfile:
             writer = csv.writer(csvfile)
-            writer.writerow(columns)
-
-            for row in rows:
-                row_list = list(row)
-                page_num = (
-                    row_list[page_number_idx] if page_number_idx is not None else None
-                )
-
-                if page_number_idx is not None:
-                    insert_idx = page_number_idx + 1
-                    row_list.insert(
-                        insert_idx, page_num + 1 if page_num is not None else None
-                    )
-                else:
-                    row_list.insert(1, None)
-
-                writer.writerow(row_list)
+            writer.writerow(header)
+            # Rows stream straight from the cursor, so memory use stays flat
+            writer.writerows(self._iter_export_rows(counted_rows(), page_number_idx))
+
+        print(f"Exported {exported} documents to {output_file}\n")
+
+    @staticmethod
+    def _iter_export_rows(
+        rows: Iterable[Sequence], page_number_idx: Optional[int]
+    ) -> Iterator[Sequence]:
+        """Yield export rows with page_number_one_indexed inserted after page_number"""
+        if page_number_idx is None:
+            yield from rows
+            return
 
-        print(f"Exported {len(rows)} documents to {output_file}\n")
+        # Split each row once around page_number instead of copying it to a list
+        # and shifting every later column with list.insert()
+        split = page_number_idx + 1
+        for row in rows:
+            page_num = row[page_number_idx]
+            yield (
+                row[:split]
+                + (page_num + 1 if page_num is not None else None,)
+                + row[split:]
+            )
 
     def get_stats(self):
         """Print database statistics"""
@@ -484,4 +852,17 @@ class WilsonArchiveScraper:
     def close(self):
         """Close database connection"""
         if self.conn:
+            self.conn.execute("PRAGMA optimize")
             self.conn.close()
+
+
+def _scrape_pages_worker(db_path: str, page_numbers: List[int]):
+    """Scrape pages in a worker process with its own database connection and driver"""
+    scraper = WilsonArchiveScraper(db_path=db_path)
+    try:
+        asyncio.run(scraper._scrape_pages_async(page_numbers))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        scraper._close_driver()
+        scraper.close()
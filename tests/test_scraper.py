@@ -0,0 +1,292 @@
+"""
+Tests for the HTML extraction helpers of WilsonArchiveScraper, run against the
+saved fixture pages in tests/fixtures.
+"""
+
+import asyncio
+import json
+from pathlib import Path
+
+import httpx
+import pytest
+from seleniumbase.common.exceptions import NoSuchElementException
+
+import scraper as scraper_module
+from scraper import HTMLParser, WilsonArchiveScraper
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+@pytest.fixture
+def scraper(tmp_path):
+    """Scraper backed by a throwaway database"""
+    scraper = WilsonArchiveScraper(db_path=str(tmp_path / "test.db"))
+    yield scraper
+    scraper.close()
+
+
+@pytest.fixture
+def document():
+    """Parsed document fixture page"""
+    return HTMLParser((FIXTURES / "document.html").read_text(encoding="utf-8"))
+
+
+def render(html: str) -> str:
+    """Render the body of an HTML snippet"""
+    return WilsonArchiveScraper._node_text(HTMLParser(html).body)
+
+
+def test_node_text_collapses_inline_whitespace():
+    assert render("<h1>The   Situation\n in <b>China</b> </h1>") == (
+        "The Situation in China"
+    )
+
+
+def test_node_text_puts_blocks_on_their_own_lines():
+    assert render("<div><p>One</p><p>Two</p>Three</div>") == "One\nTwo\nThree"
+
+
+def test_node_text_keeps_non_breaking_space_indentation():
+    assert render("<p>&nbsp;&nbsp;Indented</p><p>  Trimmed  </p>") == (
+        "  Indented\nTrimmed"
+    )
+
+
+def test_node_text_keeps_blank_lines_from_line_breaks():
+    assert render("<p>One<br><br>Two</p>") == "One\n\nTwo"
+
+
+def test_node_text_keeps_preformatted_whitespace():
+    assert render("<pre>  keep   this\n    spacing</pre>") == (
+        "  keep   this\n    spacing"
+    )
+
+
+def test_node_text_separates_table_cells():
+    assert render("<table><tr><td>One</td><td>Two</td></tr></table>") == "One Two"
+
+
+def test_node_text_skips_hidden_content():
+    assert render("<p>Shown<!-- note --><script>var x = 1;</script></p>") == "Shown"
+
+
+def test_text_body_matches_rendered_text(scraper, document):
+    assert scraper._get_text_safe(document, ".tab-pane.active") == (
+        "Secret\n"
+        "Indefinite Duration\n"
+        "  Indented opening line\n"
+        "line two with emphasis here.\n"
+        "\n"
+        "After a paragraph break.\n"
+        "  keep   this\n"
+        "    spacing\n"
+        "Cell one Cell two"
+    )
+
+
+def test_get_pill_list_reads_section_pills(scraper, document):
+    section_titles = [(scraper._title_key(h2), h2) for h2 in document.css("h2.title")]
+    # Same encoding as the rows already in the database, so values group together
+    assert scraper._get_pill_list(section_titles, [], "Associated Places") == (
+        '["China", "Japan"]'
+    )
+
+
+def test_get_pill_list_falls_back_to_pill_blocks(scraper, document):
+    pill_blocks = [
+        (scraper._title_key(title), block)
+        for block in document.css(".pill-block, .information-block")
+        for title in block.css("h3.title, h4.title, h3.sub-title")
+    ]
+    assert json.loads(scraper._get_pill_list([], pill_blocks, "Language")) == [
+        "Japanese"
+    ]
+    assert json.loads(scraper._get_pill_list([], pill_blocks, "Donor")) == ["Carnegie"]
+    assert scraper._get_pill_list([], pill_blocks, "Subjects Discussed") is None
+
+
+def test_get_information_block_matches_subtitle(scraper, document):
+    info_blocks = [
+        (scraper._title_key(block.css_first(".sub-title")), block)
+        for block in document.css(".information-block")
+    ]
+    assert scraper._get_information_block(info_blocks, "Source") == (
+        "2020-0545, Act on Access."
+    )
+    assert scraper._get_information_block(info_blocks, "Rights") == (
+        "Para one.\nPara two."
+    )
+    assert scraper._get_information_block(info_blocks, "Donors") is None
+    assert scraper._get_information_block(info_blocks, "Original Uploaded Date") is (
+        None
+    )
+
+
+def test_scrape_document_reads_every_field(scraper, monkeypatch):
+    async def fetch(url, ready_selector):
+        return (FIXTURES / "document.html").read_text(encoding="utf-8")
+
+    monkeypatch.setattr(scraper, "fetch", fetch)
+    metadata = asyncio.run(scraper.scrape_document("https://example.org/document/1"))
+
+    assert metadata["title"] == "The Situation in China"
+    assert metadata["original_publication_date"] == "June 1989"
+    assert metadata["credits"] == (
+        "This document was made possible with support from Somebody"
+    )
+    assert json.loads(metadata["authors"]) == ["Japan. Foreign Ministry"]
+    assert json.loads(metadata["language"]) == ["Japanese"]
+    assert metadata["record_id"] == "123456"
+    assert metadata["subjects_discussed"] is None
+
+
+def test_get_document_links_dedupes_in_page_order(scraper, monkeypatch):
+    async def fetch(url, ready_selector):
+        return (FIXTURES / "search.html").read_text(encoding="utf-8")
+
+    monkeypatch.setattr(scraper, "fetch", fetch)
+    assert asyncio.run(scraper.get_document_links(0)) == [
+        f"{WilsonArchiveScraper.BASE_URL}/document/alpha",
+        f"{WilsonArchiveScraper.BASE_URL}/document/beta",
+        f"{WilsonArchiveScraper.BASE_URL}/document/gamma",
+    ]
+
+
+def test_fetch_with_driver_waits_briefly_after_timeout(scraper, monkeypatch):
+    class TimingOutDriver:
+        page_source = "<html>partial</html>"
+
+        def get(self, url):
+            pass
+
+        def wait_for_element_present(self, selector, timeout):
+            raise NoSuchElementException(f"{selector} not present after {timeout}s")
+
+    sleeps = []
+    monkeypatch.setattr(scraper_module.time, "sleep", sleeps.append)
+    scraper.driver = TimingOutDriver()
+
+    html = scraper._fetch_with_driver("https://example.org/document/1", "h1.title")
+    assert html == "<html>partial</html>"
+    assert sleeps == [0.5]
+
+
+def fetch_with_transport(scraper, handler, url):
+    """Fetch url through a mock HTTP transport"""
+
+    async def run():
+        scraper.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        try:
+            return await scraper.fetch(url, "h1.title")
+        finally:
+            await scraper._close_client()
+
+    return asyncio.run(run())
+
+
+def test_fetch_retries_rate_limit_after_retry_after(scraper, monkeypatch):
+    responses = [
+        httpx.Response(429, headers={"Retry-After": "7"}),
+        httpx.Response(200, text="<h1 class='title'>Doc</h1>"),
+    ]
+    sleeps = []
+
+    async def sleep(delay):
+        sleeps.append(delay)
+
+    monkeypatch.setattr(scraper_module.asyncio, "sleep", sleep)
+    html = fetch_with_transport(
+        scraper, lambda request: responses.pop(0), "https://example.org/document/1"
+    )
+    assert html == "<h1 class='title'>Doc</h1>"
+    assert sleeps == [7.0]
+
+
+def test_fetch_gives_up_on_rate_limit_without_browser(scraper, monkeypatch):
+    async def sleep(delay):
+        pass
+
+    def fail_fetch_with_driver(url, ready_selector):
+        raise AssertionError("rate limits must not fall back to the browser")
+
+    monkeypatch.setattr(scraper_module.asyncio, "sleep", sleep)
+    monkeypatch.setattr(scraper, "_fetch_with_driver", fail_fetch_with_driver)
+    with pytest.raises(httpx.HTTPStatusError):
+        fetch_with_transport(
+            scraper, lambda request: httpx.Response(429), "https://example.org/x"
+        )
+
+
+def test_fetch_requires_an_open_session(scraper):
+    with pytest.raises(RuntimeError):
+        asyncio.run(scraper.fetch("https://example.org/document/1", "h1.title"))
+
+
+def test_session_closes_its_client_for_each_event_loop(scraper):
+    async def open_session():
+        async with scraper.session():
+            client = scraper.client
+            assert client is not None
+        return client
+
+    first, second = asyncio.run(open_session()), asyncio.run(open_session())
+    assert first is not second
+    assert first.is_closed and second.is_closed
+    assert scraper.client is None
+
+
+def test_get_scraped_urls_ignores_rows_without_a_title(scraper):
+    scraper.save_documents_bulk(
+        [
+            {"document_url": "https://example.org/document/1", "title": "Saved"},
+            {"document_url": "https://example.org/document/2"},
+        ]
+    )
+    assert scraper.get_scraped_urls(
+        ["https://example.org/document/1", "https://example.org/document/2"]
+    ) == {"https://example.org/document/1"}
+
+
+def test_scrape_page_drops_documents_without_a_title(scraper, monkeypatch):
+    async def fetch(url, ready_selector):
+        if "search?" in url:
+            return (FIXTURES / "search.html").read_text(encoding="utf-8")
+        if url.endswith("/beta"):
+            return "<html><body>Still loading</body></html>"
+        return (FIXTURES / "document.html").read_text(encoding="utf-8")
+
+    monkeypatch.setattr(scraper, "fetch", fetch)
+    asyncio.run(scraper._scrape_pages_async([0]))
+
+    assert scraper.get_scraped_urls(asyncio.run(scraper.get_document_links(0))) == {
+        f"{WilsonArchiveScraper.BASE_URL}/document/alpha",
+        f"{WilsonArchiveScraper.BASE_URL}/document/gamma",
+    }
+    assert scraper.conn.execute("SELECT COUNT(*) FROM documents").fetchone() == (2,)
+
+
+@pytest.mark.parametrize(
+    "heading",
+    [
+        "Associated&nbsp;Places",
+        "\n  Associated\n  Places\n",
+        "Associated<br>Places",
+    ],
+)
+def test_scrape_document_matches_titles_as_rendered(scraper, monkeypatch, heading):
+    html = (
+        "<h1 class='title'>Doc</h1>"
+        f"<h2 class='title'>{heading}</h2>"
+        "<div class='pills'><div class='pill'><div class='name'>"
+        "<span>China</span></div></div></div>"
+        "<div class='information-block'><div class='sub-title'>Record&nbsp;ID</div>"
+        "<div class='text'>123456</div></div>"
+    )
+
+    async def fetch(url, ready_selector):
+        return html
+
+    monkeypatch.setattr(scraper, "fetch", fetch)
+    metadata = asyncio.run(scraper.scrape_document("https://example.org/document/1"))
+    assert metadata["associated_places"] == '["China"]'
+    assert metadata["record_id"] == "123456"